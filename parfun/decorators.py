@@ -22,6 +22,7 @@ def parfun(
     profile: bool = False,
     trace_export: Optional[str] = None,
     partition_size_estimator_factory: Callable[[], PartitionSizeEstimator] = LinearRegessionEstimator,
+    micro_batch_size: Optional[int] = None,
 ) -> Callable:
     """
     Returns a function decorator that automatically parallelizes a function.
@@ -71,6 +72,13 @@ def parfun(
     :type trace_export: str
     :param partition_size_estimator_factory: the partition size estimator class to use
     :type partition_size_estimator_factory: Callable[[], PartitionSizeEstimator]
+    :param micro_batch_size:
+        If defined, submits the partitions to the parallel backend in batches of ``micro_batch_size`` partitions, each
+        batch being processed sequentially by a single task.
+
+        This reduces the scheduling and serialization overhead of functions split in many small partitions, at the cost
+        of a coarser load balancing between workers.
+    :type micro_batch_size: int | None
 
     :return: a decorated function
     :rtype: Callable
@@ -88,6 +96,7 @@ def parfun(
             profile=profile,
             trace_export=trace_export,
             partition_size_estimator_factory=partition_size_estimator_factory,
+            micro_batch_size=micro_batch_size,
         )
 
         @wraps(function)
@@ -1,5 +1,6 @@
 import collections
 import inspect
+import weakref
 from inspect import Parameter
 from typing import Any, Callable, Dict, Optional, OrderedDict, Set, Tuple, Type
 
@@ -36,8 +37,52 @@ class FunctionSignature:
 
     return_type: Optional[Type] = attrs.field()
 
+    # Derived from the parameters at construction, so that `assign()` does not have to re-scan them on every call.
+    _arg_parameters: Tuple[inspect.Parameter, ...] = attrs.field(init=False, repr=False, eq=False)
+    _required_positional_only_names: Tuple[str, ...] = attrs.field(init=False, repr=False, eq=False)
+    _required_kwarg_names: Tuple[str, ...] = attrs.field(init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        # The class is frozen, hence the use of `object.__setattr__()`.
+
+        object.__setattr__(self, "_arg_parameters", tuple(self.args.values()))
+        object.__setattr__(
+            self,
+            "_required_positional_only_names",
+            tuple(
+                a.name
+                for a in self.args.values()
+                if a.kind == Parameter.POSITIONAL_ONLY and a.default == Parameter.empty
+            ),
+        )
+        object.__setattr__(
+            self, "_required_kwarg_names", tuple(a.name for a in self.kwargs.values() if a.default == Parameter.empty)
+        )
+
     @classmethod
     def from_function(cls, function: Callable) -> "FunctionSignature":
+        """
+        Inspects the function's signature.
+
+        Signatures are cached for the lifetime of the function, as :py:func:`inspect.signature` is expensive.
+        """
+
+        try:
+            return _SIGNATURE_CACHE[function]
+        except (KeyError, TypeError):  # TypeError: unhashable callable.
+            pass
+
+        function_signature = cls._inspect_function(function)
+
+        try:
+            _SIGNATURE_CACHE[function] = function_signature
+        except TypeError:  # Unhashable or not weak-referenceable callable.
+            pass
+
+        return function_signature
+
+    @classmethod
+    def _inspect_function(cls, function: Callable) -> "FunctionSignature":
         signature = inspect.signature(function)
 
         if signature.return_annotation not in (inspect.Signature.empty, None):
@@ -71,22 +116,19 @@ class FunctionSignature:
         # Assigns positional arguments.
 
         named_args = collections.OrderedDict(
-            (arg_type.name, arg_value) for arg_type, arg_value in zip(self.args.values(), args)
+            (arg_type.name, arg_value) for arg_type, arg_value in zip(self._arg_parameters, args)
         )
 
-        if len(args) > len(self.args):
+        if len(args) > len(self._arg_parameters):
             if self.has_var_arg:
                 var_args = tuple(args[len(named_args) :])
             else:
-                raise ValueError(f"expected {len(self.args)} arguments, got {len(args)}.")
+                raise ValueError(f"expected {len(self._arg_parameters)} arguments, got {len(args)}.")
         else:
-            unassigned_args = [
-                a
-                for a in list(self.args.values())[len(args) :]
-                if a.kind == Parameter.POSITIONAL_ONLY and a.default == Parameter.empty
-            ]
+            # Required positional only parameters always precede the other positional parameters.
+            unassigned_args = self._required_positional_only_names[len(args) :]
             if len(unassigned_args) > 0:
-                unassigned_kwarg_names = ", ".join(a.name for a in unassigned_args)
+                unassigned_kwarg_names = ", ".join(unassigned_args)
                 raise ValueError(f"unassigned positional parameter(s): {unassigned_kwarg_names}.")
 
             var_args = tuple()
@@ -104,18 +146,17 @@ class FunctionSignature:
                 invalid_kwarg_names = ", ".join(a for a in invalid_kwargs)
                 raise ValueError(f"invalid keyword parameter(s): {invalid_kwarg_names}.")
 
-        unassigned_kwargs = [
-            a
-            for a in self.kwargs.values()
-            if a.default == Parameter.empty and a.name not in named_args and a.name not in kwargs
-        ]
+        unassigned_kwargs = [a for a in self._required_kwarg_names if a not in named_args and a not in kwargs]
         if len(unassigned_kwargs) > 0:
-            unassigned_kwarg_names = ", ".join(a.name for a in unassigned_kwargs)
+            unassigned_kwarg_names = ", ".join(unassigned_kwargs)
             raise ValueError(f"unassigned keyword parameter(s): {unassigned_kwarg_names}.")
 
         return NamedArguments(args=named_args, kwargs=kwargs, var_args=var_args)
 
 
+_SIGNATURE_CACHE: "weakref.WeakKeyDictionary[Callable, FunctionSignature]" = weakref.WeakKeyDictionary()
+
+
 @attrs.define(frozen=True)
 class NamedArguments:
     """Contains the argument values of a function call, but associated with their respective names, based on the
@@ -1,7 +1,9 @@
 import logging
-from inspect import Parameter, currentframe
-from itertools import repeat
-from typing import Callable, Iterable, Optional, Tuple, Union
+import pickle
+from contextvars import ContextVar
+from inspect import Parameter
+from itertools import islice, repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
 import attrs
 
@@ -14,10 +16,12 @@ from parfun.partition.object import PartitionGenerator
 from parfun.partition_size_estimator.linear_regression_estimator import LinearRegessionEstimator
 from parfun.partition_size_estimator.mixins import PartitionSizeEstimator
 from parfun.profiler.functions import export_task_trace, print_profile_trace, timed_combine_with, timed_partition
-from parfun.profiler.object import PartitionedTaskTrace
+from parfun.profiler.object import PartitionedTaskTrace, TraceTime
 
+T = TypeVar("T")
 
-@attrs.define(init=False)
+
+@attrs.define(init=False, slots=True, weakref_slot=False, eq=False)
 class ParallelFunction:
     """Wraps a function so that it executes in parallel using a map-reduce/scatter-gather approach.
 
@@ -38,6 +42,8 @@ class ParallelFunction:
     profile: bool = attrs.field()
     trace_export: Optional[str] = attrs.field()
 
+    micro_batch_size: Optional[int] = attrs.field()
+
     _partition_size_estimator: Optional[PartitionSizeEstimator] = attrs.field(init=False, default=None)
 
     _function_signature: FunctionSignature = attrs.field(init=False)
@@ -54,6 +60,7 @@ class ParallelFunction:
         profile: bool = False,
         trace_export: Optional[str] = None,
         partition_size_estimator_factory: Callable[[], PartitionSizeEstimator] = LinearRegessionEstimator,
+        micro_batch_size: Optional[int] = None,
     ):
         self.__attrs_init__(  # type: ignore[attr-defined]
             function=function,
@@ -64,6 +71,7 @@ class ParallelFunction:
             fixed_partition_size=fixed_partition_size,
             profile=profile,
             trace_export=trace_export,
+            micro_batch_size=micro_batch_size,
         )
 
         self._function_signature = FunctionSignature.from_function(self.function)
@@ -82,6 +90,11 @@ class ParallelFunction:
         if value is not None and not isinstance(value, int) and not callable(value):
             raise ValueError(f"`{attribute.name}` should be either an integer, a callable or `None`.")
 
+    @micro_batch_size.validator
+    def _micro_batch_size_validator(self, attribute, value):
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError(f"`{attribute.name}` should be either a positive integer or `None`.")
+
     def _validate_function_signature(self):
         if self._function_signature.has_var_arg or self._function_signature.has_var_kwarg:
             return
@@ -90,20 +103,22 @@ class ParallelFunction:
             raise ValueError("parfun toolkit does not support positional only parameters yet.")
 
     def __call__(self, *args, **kwargs) -> FunctionOutputType:
+        function = self.function
+        function_name = self.function_name
+        partition_size_estimator = self._partition_size_estimator
+
         current_backend = get_parallel_backend()
         allows_nested_tasks = current_backend is not None and current_backend.allows_nested_tasks()
 
         # Note: is_nested_parallelism check should appears before any backend check, as unsupported nested function
         # calls will have an empty backend setup.
         if is_nested_parallelism() and not allows_nested_tasks:
-            logging.debug(
-                f"backend does not support nested parallelism. Running {self.function.__name__} sequentially."
-            )
-            return self.function(*args, **kwargs)
+            logging.debug(f"backend does not support nested parallelism. Running {function.__name__} sequentially.")
+            return function(*args, **kwargs)
 
         if current_backend is None:
-            logging.warning(f"no parallel backend engine set, run `{self.function_name}(...)` sequentially.")
-            return self.function(*args, **kwargs)
+            logging.warning(f"no parallel backend engine set, run `{function_name}(...)` sequentially.")
+            return function(*args, **kwargs)
 
         # 1. Assigns a name to each argument based on the decorated function's signature.
 
@@ -114,45 +129,69 @@ class ParallelFunction:
         non_partitioned_args, partition_generator = self.split(named_args)
 
         with current_backend.session() as backend_session:
-            # 3. Preloads the non-partitioned arguments for each partition.
-            preloaded_non_partitioned_args = backend_session.preload_value(non_partitioned_args)
+            # 3. Preloads the function and the non-partitioned arguments, as these are identical for each partition.
+            #
+            # The arguments are flattened as keyword arguments once, so that tasks do not have to merge
+            # `NamedArguments`.
+            assert len(non_partitioned_args.var_args) == 0
+            non_partitioned_kwargs = {**non_partitioned_args.args, **non_partitioned_args.kwargs}
+
+            preloaded_function = backend_session.preload_value(function)
+
+            # Small arguments are directly sent with every task, saving a round-trip to the backend's object store.
+            if _is_small_value(non_partitioned_kwargs):
+                preloaded_non_partitioned_kwargs = non_partitioned_kwargs
+            else:
+                preloaded_non_partitioned_kwargs = backend_session.preload_value(non_partitioned_kwargs)
+
+            if allows_nested_tasks:
+                preloaded_nested_backend = backend_session.preload_value(current_backend)
+            else:
+                preloaded_nested_backend = None
 
             # 4. Generates the partition
 
             initial_partition_size, fixed_partition_size = self._get_user_partition_sizes(args, kwargs)
 
             partitions = timed_partition(
-                partition_generator, self._partition_size_estimator, initial_partition_size, fixed_partition_size
+                partition_generator, partition_size_estimator, initial_partition_size, fixed_partition_size
             )
 
             # 5. Submits the function to the parallel backend.
 
-            if allows_nested_tasks:
-                nested_backend = current_backend
+            if self.micro_batch_size is None:
+                results = parallel_timed_map(
+                    apply_function,
+                    repeat(preloaded_function),
+                    repeat(preloaded_non_partitioned_kwargs),
+                    partitions,
+                    repeat(preloaded_nested_backend),
+                    backend_session=backend_session,
+                )
             else:
-                nested_backend = None
-
-            results = parallel_timed_map(
-                apply_function,
-                repeat(self.function),
-                repeat(preloaded_non_partitioned_args),
-                partitions,
-                repeat(nested_backend),
-                backend_session=backend_session,
-            )
+                results = _unbatch_results(
+                    parallel_timed_map(
+                        apply_function_batch,
+                        repeat(preloaded_function),
+                        repeat(preloaded_non_partitioned_kwargs),
+                        _batched(partitions, self.micro_batch_size),
+                        repeat(preloaded_nested_backend),
+                        backend_session=backend_session,
+                    )
+                )
 
             # 6. Combines results
 
-            combined_result, task_trace = timed_combine_with(self.combine_with, self._partition_size_estimator, results)
+            combined_result, task_trace = timed_combine_with(self.combine_with, partition_size_estimator, results)
 
         if self.profile:
-            print_profile_trace(self.function, self.function_name, self._partition_size_estimator, task_trace)
+            print_profile_trace(function, function_name, partition_size_estimator, task_trace)
 
         if self.trace_export:
             export_task_trace(self.trace_export, task_trace)
 
         logging.info(
-            f"Run `{self.function_name}(...)` with {task_trace.partition_count} of "
+            f"Run `{function_name}(...)` with {task_trace.partition_count} of "
             f"sub-tasks using backend {current_backend.__class__} successfully"
         )
 
@@ -174,27 +213,66 @@ class ParallelFunction:
         return initial_partition_size, fixed_partition_size
 
 
+_SMALL_VALUE_MAX_SIZE = 16 * 1024
+"""Values that serialize to fewer bytes than this are not preloaded to the backend."""
+
+
+def _is_small_value(value: Any) -> bool:
+    """
+    Returns True if ``value`` serializes to less than ``_SMALL_VALUE_MAX_SIZE`` bytes.
+
+    Stops the serialization as soon as the limit is reached, so that large values do not get fully serialized twice.
+    """
+
+    try:
+        pickle.Pickler(_SizeLimitedWriter(_SMALL_VALUE_MAX_SIZE), protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    except Exception:
+        # Too large, or not serializable by the standard pickle module (e.g. lambdas).
+        return False
+
+    return True
+
+
+class _SizeLimitExceeded(Exception):
+    pass
+
+
+class _SizeLimitedWriter:
+    """A write-only file object that discards its content, and raises once more than ``max_size`` bytes are written."""
+
+    def __init__(self, max_size: int):
+        self._remaining_size = max_size
+
+    def write(self, data) -> int:
+        size = memoryview(data).nbytes
+
+        self._remaining_size -= size
+        if self._remaining_size < 0:
+            raise _SizeLimitExceeded()
+
+        return size
+
+
+_IN_APPLY_FUNCTION: ContextVar[bool] = ContextVar("parfun_in_apply_function", default=False)
+"""Set to True while `apply_function()` is executing in the current context."""
+
+
 def is_nested_parallelism():
-    """Returns True if there is any call to `_apply_function()` in the current call stack."""
+    """Returns True if there is any call to `apply_function()` in the current call stack."""
 
-    frame = currentframe()
-    while frame is not None:
-        if frame.f_code.co_name == apply_function.__name__ and frame.f_code.co_filename == __file__:
-            return True
-        frame = frame.f_back
-    return False
+    return _IN_APPLY_FUNCTION.get()
 
 
 def apply_function(
     function: Callable[[PartitionType], FunctionOutputType],
-    non_partitioned_args: NamedArguments,
+    non_partitioned_kwargs: Dict[str, Any],
     partition: Tuple[NamedArguments, PartitionedTaskTrace],
     backend: Optional[BackendEngine] = None,
 ) -> Tuple[FunctionOutputType, PartitionedTaskTrace]:
     """
     Runs the function with the partitioned object and its profiling trace.
 
-    :param non_partitioned_args: the function arguments that are identical for every function call.
+    :param non_partitioned_kwargs: the function arguments that are identical for every function call, by name.
     :param partition: the partitioned arguments and the associated partition task trace.
     :param backend: if not None, setup this backend before executing the function.
 
@@ -203,15 +281,61 @@ def apply_function(
 
     partitioned_args, trace = partition
 
-    merged_args = non_partitioned_args.merge(partitioned_args)
-    assert len(non_partitioned_args.var_args) == 0
-
-    args, kwargs = merged_args.as_args_kwargs()
+    args = partitioned_args.var_args
+    kwargs = {**non_partitioned_kwargs, **partitioned_args.args, **partitioned_args.kwargs}
 
-    if backend is not None:
-        with set_parallel_backend_context(backend):
+    token = _IN_APPLY_FUNCTION.set(True)
+    try:
+        if backend is not None:
+            with set_parallel_backend_context(backend):
+                result = function(*args, **kwargs)
+        else:
             result = function(*args, **kwargs)
-    else:
-        result = function(*args, **kwargs)
+    finally:
+        _IN_APPLY_FUNCTION.reset(token)
 
     return result, trace
+
+
+def apply_function_batch(
+    function: Callable[[PartitionType], FunctionOutputType],
+    non_partitioned_kwargs: Dict[str, Any],
+    partitions: Tuple[Tuple[NamedArguments, PartitionedTaskTrace], ...],
+    backend: Optional[BackendEngine] = None,
+) -> List[Tuple[FunctionOutputType, PartitionedTaskTrace]]:
+    """
+    Same as :py:func:`apply_function`, but sequentially runs the function on multiple partitions within a single task.
+
+    :returns the function's output and the original partition task trace of every partition.
+    """
+
+    return [apply_function(function, non_partitioned_kwargs, partition, backend) for partition in partitions]
+
+
+def _batched(iterable: Iterable[T], batch_size: int) -> Iterator[Tuple[T, ...]]:
+    """Lazily groups the iterable's values in tuples of ``batch_size`` values. The last tuple might be shorter."""
+
+    iterator = iter(iterable)
+    while True:
+        batch = tuple(islice(iterator, batch_size))
+
+        if not batch:
+            return
+
+        yield batch
+
+
+def _unbatch_results(
+    batched_results: Iterable[Tuple[List[Tuple[Any, PartitionedTaskTrace]], TraceTime]],
+) -> Iterator[Tuple[Tuple[Any, PartitionedTaskTrace], TraceTime]]:
+    """
+    Flattens the results of :py:func:`apply_function_batch` tasks.
+
+    The duration of every task is split between its partitions, proportionally to their partition sizes.
+    """
+
+    for batch_results, batch_duration in batched_results:
+        batch_partition_size = sum(trace.partition_size for _, trace in batch_results)
+
+        for result, trace in batch_results:
+            yield (result, trace), batch_duration * trace.partition_size // batch_partition_size
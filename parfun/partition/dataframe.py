@@ -2,9 +2,11 @@
 A collection of pre-define APIs to help users partition dataframe data
 """
 
-from typing import Iterable, List, Tuple
+from math import ceil
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:
     raise ImportError("Pandas dependency missing. Use `pip install 'parfun[pandas]'` to install Pandas.")
@@ -48,29 +50,41 @@ def df_by_row(*dfs: pd.DataFrame) -> PartitionGenerator[Tuple[pd.DataFrame, ...]
 
     chunk_size = yield None
 
+    dfs = tuple(_combine_arrow_chunks(df) for df in dfs)
+    slicers = [_row_slicer(df) for df in dfs]
+
     def dfs_chunk(rng_start: int, rng_end: int) -> Tuple[pd.DataFrame, ...]:
-        return tuple(df.iloc[rng_start:rng_end] for df in dfs)
+        rows = slice(rng_start, rng_end)
+        return tuple(slicer(rows) for slicer in slicers)
 
     total_size = dfs[0].shape[0]
     range_start = 0
-    range_end = chunk_size
-    while range_end < total_size:
-        chunk_size = yield chunk_size, dfs_chunk(range_start, range_end)
+    while range_start < total_size:
+        # Iterates over the chunk boundaries with `range()` for as long as the requested chunk size does not change.
+        current_chunk_size = chunk_size
+        for range_start in range(range_start, total_size, current_chunk_size):
+            range_end = min(range_start + current_chunk_size, total_size)
 
-        range_start = range_end
-        range_end += chunk_size
+            chunk_size = yield range_end - range_start, dfs_chunk(range_start, range_end)
+
+            if chunk_size != current_chunk_size:
+                break
 
-    if range_start < total_size:
-        yield total_size - range_start, dfs_chunk(range_start, total_size)
+        range_start = range_end
 
 
-def df_by_group(*args, **kwargs) -> PartitionFunction[pd.DataFrame]:
+def df_by_group(
+    *args, weight_fn: Optional[Callable[[pd.DataFrame], float]] = None, **kwargs
+) -> PartitionFunction[pd.DataFrame]:
     """
     Partitions one or multiple Pandas dataframes by groups of identical numbers of rows, similar to
     :py:func:`pandas.DataFrame.groupby`.
 
     See :py:func:`pandas.DataFrame.groupby` for function parameters.
 
+    If multiple dataframes are given, the groups are computed on the first dataframe, and the other dataframes are
+    partitioned by the same row positions.
+
     .. code:: python
 
         df_1 = pd.DataFrame({"country": ["USA", "China", "Belgium"], "capital": ["Washington", "Beijing", "Brussels"]})
@@ -91,62 +105,282 @@ def df_by_group(*args, **kwargs) -> PartitionFunction[pd.DataFrame]:
         #     country iso_code
         #   0     USA       US)]
 
+    :param weight_fn:
+        If defined, estimates the processing cost of every group from its rows in the first dataframe. Partitions are
+        then sized by their total weight instead of their number of rows, and the heaviest groups are emitted first
+        (longest-processing-time-first scheduling), so that costly groups do not end up as straggler tasks.
+
+        Weights should be expressed in the same unit as a number of rows, e.g. ``lambda df: len(df) ** 2`` for a
+        function of quadratic complexity.
+
     """
 
     def generator(*dfs: pd.DataFrame) -> PartitionGenerator[Tuple[pd.DataFrame, ...]]:
         __validate_dfs_parameter(*dfs)
 
-        groups: Iterable[Tuple[pd.DataFrame, ...]] = zip(
-            *((group for _name, group in df.groupby(*args, **kwargs)) for df in dfs)
-        )
+        dfs = tuple(_combine_arrow_chunks(df) for df in dfs)
+
+        # Groups the first dataframe only. The other dataframes are partitioned by the same row positions.
+        order, offsets = _sorted_group_rows(_group_ids(dfs[0], args, kwargs))
+
+        if weight_fn is None:
+            cumulative_weights = offsets
+        else:
+            order, offsets, weights = _sort_groups_by_weight(dfs[0], order, offsets, weight_fn)
+            cumulative_weights = np.concatenate(([0], np.cumsum(weights)))
 
-        it = iter(groups)
+        def take_groups(group_begin: int, group_end: int) -> Tuple[pd.DataFrame, ...]:
+            rows = order[offsets[group_begin] : offsets[group_end]]
+            return tuple(df.take(rows) for df in dfs)
 
-        chunked_group: Tuple[List[pd.DataFrame], ...] = tuple([] for _ in range(0, len(dfs)))
-        chunked_group_size: int = 0
+        def chunk_size(group_begin: int, group_end: int) -> int:
+            return max(1, ceil(cumulative_weights[group_end] - cumulative_weights[group_begin]))
 
         target_chunk_size = yield None
 
-        def concat_chunked_group_dfs(chunked_group: Tuple[List[pd.DataFrame], ...]):
-            return tuple(pd.concat(chunked_dfs) for chunked_dfs in chunked_group)
+        n_groups = len(offsets) - 1
+        group_begin = 0
+        while group_begin < n_groups:
+            # Binary searches the first group that fills the requested chunk size, instead of iterating every group.
+            target_weight = cumulative_weights[group_begin] + target_chunk_size
+            group_end = max(group_begin + 1, int(np.searchsorted(cumulative_weights, target_weight, side="left")))
+
+            if group_end > n_groups:
+                break
+
+            target_chunk_size = yield chunk_size(group_begin, group_end), take_groups(group_begin, group_end)
+            group_begin = group_end
 
-        while True:
-            try:
-                group = next(it)
-                assert isinstance(group, tuple)
-                assert isinstance(group[0], pd.DataFrame)
+        if offsets[group_begin] < offsets[n_groups]:
+            yield chunk_size(group_begin, n_groups), take_groups(group_begin, n_groups)
 
-                group_size = group[0].shape[0]
+    return generator
+
+
+_COLUMN_GROUP_KWARGS = {"by", "sort"}
 
-                if any(group_df.shape[0] != group_size for group_df in group[1:]):
-                    raise ValueError("all dataframe group sizes should be identical.")
 
-                chunked_group_size += group_size
+def _group_ids(df: pd.DataFrame, args: Tuple, kwargs: Dict[str, Any]) -> np.ndarray:
+    """
+    Returns the group number of every row of ``df``, in the iteration order of :py:meth:`pandas.DataFrame.groupby`, or
+    -1 if the row does not belong to any group.
+    """
 
-                for i, group_df in enumerate(group):
-                    chunked_group[i].append(group_df)
+    keys = _column_group_keys(df, args, kwargs)
 
-                if chunked_group_size >= target_chunk_size:
-                    target_chunk_size = yield chunked_group_size, concat_chunked_group_dfs(chunked_group)
+    if keys is not None:
+        # Fast path: grouping by column values does not require the groupby machinery.
+        return _column_group_ids(df, keys, sort=kwargs.get("sort", True))
 
-                    chunked_group = tuple([] for _ in range(0, len(dfs)))
-                    chunked_group_size = 0
-            except StopIteration:
-                if chunked_group_size > 0:
-                    yield chunked_group_size, concat_chunked_group_dfs(chunked_group)
+    return df.groupby(*args, **kwargs).ngroup().fillna(-1).to_numpy(dtype=np.int64)
 
-                return
 
-    return generator
+def _column_group_keys(df: pd.DataFrame, args: Tuple, kwargs: Dict[str, Any]) -> Optional[List[Any]]:
+    """
+    Returns the column names the dataframe is grouped by, or ``None`` if the ``groupby()`` parameters are not simple
+    column names and require the generic ``groupby()`` implementation.
+    """
+
+    if len(args) > 1 or any(kwarg not in _COLUMN_GROUP_KWARGS for kwarg in kwargs):
+        return None
+
+    if len(args) == 1:
+        if "by" in kwargs:
+            return None
+        by = args[0]
+    else:
+        by = kwargs.get("by")
+
+    if isinstance(by, str):
+        keys = [by]
+    elif isinstance(by, list) and len(by) > 0 and all(isinstance(key, str) for key in by):
+        keys = by
+    else:
+        return None
+
+    if isinstance(df.columns, pd.MultiIndex) or df.columns.has_duplicates:
+        return None
+
+    if any(key not in df.columns or key in df.index.names for key in keys):
+        # Index levels, and keys that are both an index level and a column (ambiguous), are handled by `groupby()`.
+        return None
+
+    if any(isinstance(df[key].dtype, pd.CategoricalDtype) for key in keys):
+        # Categorical groups depend on the `observed` parameter.
+        return None
+
+    return keys
+
+
+def _column_group_ids(df: pd.DataFrame, keys: List[Any], sort: bool) -> np.ndarray:
+    """Computes the group numbers of ``df`` by the values of the ``keys`` columns. Rows with missing values get -1."""
+
+    codes = [pd.factorize(df[key], sort=True)[0] for key in keys]
+
+    if len(codes) == 1:
+        group_ids = codes[0]
+    else:
+        stacked_codes = np.stack(codes, axis=1)
+        rows = np.flatnonzero((stacked_codes >= 0).all(axis=1))
+
+        _, row_group_ids = np.unique(stacked_codes[rows], axis=0, return_inverse=True)
+
+        group_ids = np.full(len(df), -1, dtype=np.int64)
+        group_ids[rows] = row_group_ids.reshape(-1)
+
+    if not sort:
+        # Renumbers the groups by order of first appearance.
+        group_ids = group_ids.copy()
+        rows = np.flatnonzero(group_ids >= 0)
+
+        _, first_rows = np.unique(group_ids[rows], return_index=True)
+        ranks = np.empty_like(first_rows)
+        ranks[np.argsort(first_rows)] = np.arange(0, len(first_rows))
+
+        group_ids[rows] = ranks[group_ids[rows]]
+
+    return group_ids
+
+
+def _sorted_group_rows(group_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorts the row positions by group number, ignoring the rows of group -1.
+
+    :returns the row positions ordered by group, and the offsets of every group within these positions.
+    """
+
+    rows = np.flatnonzero(group_ids >= 0)
+    group_ids = group_ids[rows]
+
+    order = rows[np.argsort(group_ids, kind="stable")]
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(group_ids))))
+
+    return order, offsets
+
+
+def _sort_groups_by_weight(
+    df: pd.DataFrame, order: np.ndarray, offsets: np.ndarray, weight_fn: Callable[[pd.DataFrame], float]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reorders the groups returned by :py:func:`_sorted_group_rows` by decreasing weight.
+
+    :returns the reordered row positions and group offsets, and the weight of every reordered group.
+    """
+
+    group_rows = [order[offsets[i] : offsets[i + 1]] for i in range(0, len(offsets) - 1)]
+    weights = np.array([weight_fn(df.take(rows)) for rows in group_rows], dtype=np.float64)
+
+    if not (np.isfinite(weights).all() and (weights >= 0).all()):
+        raise ValueError("`weight_fn` should return finite and non-negative weights.")
+
+    group_order = np.argsort(-weights, kind="stable")
+
+    if len(group_rows) > 0:
+        order = np.concatenate([group_rows[i] for i in group_order])
+
+    offsets = np.concatenate(([0], np.cumsum(np.diff(offsets)[group_order])))
+
+    return order, offsets, weights[group_order]
 
 
 def __validate_dfs_parameter(*dfs: pd.DataFrame) -> None:
     if len(dfs) < 1:
         raise ValueError("missing `dfs` parameter.")
 
-    if any(not isinstance(df, pd.DataFrame) for df in dfs):
+    first_df = dfs[0]
+    if type(first_df) is not pd.DataFrame and not isinstance(first_df, pd.DataFrame):
         raise ValueError("all `dfs` values should be DataFrame instances.")
 
-    total_size = dfs[0].shape[0]
-    if any(df.shape[0] != total_size for df in dfs[1:]):
-        raise ValueError("all DataFrames should have the same number of rows.")
+    if len(dfs) == 1:
+        return
+
+    total_size = first_df.shape[0]
+    for df in dfs[1:]:
+        if type(df) is not pd.DataFrame and not isinstance(df, pd.DataFrame):
+            raise ValueError("all `dfs` values should be DataFrame instances.")
+
+        if df.shape[0] != total_size:
+            raise ValueError("all DataFrames should have the same number of rows.")
+
+
+def _combine_arrow_chunks(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns ``df`` with its PyArrow backed columns combined into single-chunk arrays.
+
+    Slicing or taking rows from a chunked Arrow array has to walk through all its chunks, which gets expensive for
+    dataframes built by concatenation. The chunks are combined once, so that every partition is a cheap view of a
+    single contiguous array. The original dataframe is not modified.
+    """
+
+    arrow_array_type = getattr(pd.arrays, "ArrowExtensionArray", None)
+    if arrow_array_type is None:
+        return df
+
+    # Only looks at the columns' dtypes first, as accessing every column's array is expensive for wide dataframes.
+    arrow_columns = [i for i, dtype in enumerate(df.dtypes) if _is_arrow_dtype(dtype)]
+    if not arrow_columns:
+        return df
+
+    combined_df = df
+    for i in arrow_columns:
+        array = df.iloc[:, i].array
+
+        if not isinstance(array, arrow_array_type):
+            continue
+
+        chunked_array = array.__arrow_array__()
+        if chunked_array.num_chunks <= 1:
+            continue
+
+        if combined_df is df:
+            combined_df = df.copy(deep=False)
+
+        combined_df.isetitem(i, pd.array(chunked_array.combine_chunks(), dtype=array.dtype))
+
+    return combined_df
+
+
+def _is_arrow_dtype(dtype: Any) -> bool:
+    """Returns True if ``dtype`` is a PyArrow backed extension dtype."""
+
+    arrow_dtype_type = getattr(pd, "ArrowDtype", None)
+    if arrow_dtype_type is not None and isinstance(dtype, arrow_dtype_type):
+        return True
+
+    return isinstance(dtype, pd.StringDtype) and dtype.storage in ("pyarrow", "pyarrow_numpy")
+
+
+def _row_slicer(df: pd.DataFrame) -> Callable[[slice], pd.DataFrame]:
+    """
+    Returns a function that positionally slices the rows of ``df``.
+
+    Slices directly the blocks of the dataframe's block manager when possible, skipping the ``iloc`` indexing layers and
+    sharing the same column index between all slices. Falls back on ``iloc`` for object columns or if the pandas
+    internals are not available.
+    """
+
+    def iloc_slicer(rows: slice) -> pd.DataFrame:
+        return df.iloc[rows]
+
+    if any(dtype == object for dtype in df.dtypes):
+        return iloc_slicer
+
+    try:
+        mgr = df._mgr
+        mgr_type = type(mgr)
+        blocks = tuple(mgr.blocks)
+        columns, index = mgr.axes  # The block manager axes are transposed: axis 1 is the dataframe's rows.
+        constructor_from_mgr = df._constructor_from_mgr
+
+        def block_slicer(rows: slice) -> pd.DataFrame:
+            sliced_blocks = tuple(block.slice_block_rows(rows) for block in blocks)
+            sliced_mgr = mgr_type(sliced_blocks, [columns, index[rows]], verify_integrity=False)
+            return constructor_from_mgr(sliced_mgr, axes=sliced_mgr.axes).__finalize__(df)
+
+        # Makes sure these internals behave as expected with the installed pandas version.
+        if not block_slicer(slice(0, 1)).equals(df.iloc[0:1]):
+            return iloc_slicer
+    except (AttributeError, TypeError, ValueError):
+        return iloc_slicer
+
+    return block_slicer
@@ -1,4 +1,6 @@
-from typing import Callable, Optional, Sequence, Tuple, TypeVar, cast
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar, cast
 
 from parfun.partition.object import PartitionGenerator, PartitionType, SmartPartitionGenerator, SimplePartitionIterator
 
@@ -289,6 +291,98 @@ def partition_zip(*generators: PartitionGenerator) -> PartitionGenerator[Tuple]:
         return
 
 
+def partition_prefetch(
+    generator: PartitionGenerator[PartitionType], ahead: int = 2
+) -> PartitionGenerator[PartitionType]:
+    """
+    Computes up to ``ahead`` partitions in advance from a background thread, so that the partitioning of the next values
+    overlaps with the submission and the execution of the current ones.
+
+    .. code:: python
+
+        @parfun(
+            split=all_arguments(lambda df: partition_prefetch(df_by_group(by="year")(df), ahead=4)),
+            combine_with=df_concat,
+        )
+        def func(df: pd.DataFrame):
+            ...
+
+    Only worthwhile for partitioning functions that do significant work, like :py:func:`df_by_group`: partitioning
+    functions that return views, like :py:func:`df_by_row`, are faster than the thread synchronisation.
+
+    Smart generators are fed with the most recently requested partition size. The prefetched partitions might hence lag
+    behind the partition size estimator by up to ``ahead`` partitions.
+    """
+
+    if ahead < 1:
+        raise ValueError("`ahead` should be a strictly positive integer.")
+
+    try:
+        first_value = next(generator)
+    except StopIteration:
+        return
+
+    is_smart = first_value is None
+
+    values: queue.Queue = queue.Queue(maxsize=ahead)
+    stopped = threading.Event()
+
+    # Shared with the producer thread, as a mutable container.
+    requested_partition_size: List[Any] = [None]
+
+    def put(item: Tuple[str, Any]) -> bool:
+        """Returns False if the consumer stopped before the item could be enqueued."""
+
+        while not stopped.is_set():
+            try:
+                values.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def producer():
+        try:
+            if not is_smart and not put(("value", first_value)):
+                return
+
+            while True:
+                value: Any
+                if is_smart:
+                    value = cast(SmartPartitionGenerator, generator).send(requested_partition_size[0])
+                    _validate_smart_partition_value(value)
+                else:
+                    value = next(generator)
+
+                if not put(("value", value)):
+                    return
+        except StopIteration:
+            put(("end", None))
+        except BaseException as e:
+            put(("error", e))
+
+    producer_thread = threading.Thread(target=producer, name="parfun_partition_prefetch", daemon=True)
+
+    try:
+        if is_smart:
+            requested_partition_size[0] = yield None
+
+        producer_thread.start()
+
+        while True:
+            kind, value = values.get()
+
+            if kind == "end":
+                return
+            elif kind == "error":
+                raise value
+
+            requested_partition_size[0] = yield value
+    finally:
+        stopped.set()
+
+
 def _validate_partition_zip_smart_partition_value(
     partition_value: Tuple[int, PartitionType], partition_size: Optional[int]
 ):
@@ -1,3 +1,4 @@
+import functools
 import unittest
 from collections import OrderedDict
 
@@ -47,6 +48,34 @@ class TestFunctionSignature(unittest.TestCase):
         self.assertEqual(assigned_args.kwargs, {"arg_4": 4})
         self.assertEqual(assigned_args.var_args, (3,))
 
+        def function_3(arg_1, /, arg_2, *, arg_3, arg_4=None):
+            pass
+
+        signature = FunctionSignature.from_function(function_3)
+
+        self.assertRaises(ValueError, lambda: signature.assign([], {"arg_2": 2, "arg_3": 3}))
+        self.assertRaises(ValueError, lambda: signature.assign([1, 2], {}))
+
+        assigned_args = signature.assign([1], {"arg_2": 2, "arg_3": 3})
+
+        self.assertEqual(assigned_args.args, OrderedDict(arg_1=1))
+        self.assertEqual(assigned_args.kwargs, {"arg_2": 2, "arg_3": 3})
+
+    def test_from_function_cache(self):
+        def function(arg_1, arg_2=None):
+            pass
+
+        signature = FunctionSignature.from_function(function)
+
+        self.assertIs(FunctionSignature.from_function(function), signature)
+        other_signature = FunctionSignature.from_function(lambda arg_1, arg_2=None: None)
+        self.assertIsNot(other_signature, signature)
+        self.assertEqual(other_signature.args.keys(), signature.args.keys())
+
+        # Builtins and callable objects.
+        self.assertFalse(FunctionSignature.from_function(sum).has_var_kwarg)
+        self.assertFalse(FunctionSignature.from_function(functools.partial(function, 1)).has_var_arg)
+
 
 if __name__ == "__main__":
     unittest.main()
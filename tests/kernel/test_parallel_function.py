@@ -1,8 +1,16 @@
+import math
 import unittest
+from typing import Any, Callable, List
 
-from parfun.entry_point import set_parallel_backend
+from parfun.backend.local_single_process import LocalSingleProcessBackend, LocalSingleProcessSession
+from parfun.backend.mixins import BackendSession
+from parfun.backend.profiled_future import ProfiledFuture
+from parfun.entry_point import set_parallel_backend, set_parallel_backend_context
+from parfun.kernel.function_signature import NamedArguments
 from parfun.partition.api import all_arguments, per_argument
-from parfun.kernel.parallel_function import ParallelFunction
+from parfun.partition.collection import list_by_chunk
+from parfun.kernel.parallel_function import ParallelFunction, _unbatch_results, apply_function, is_nested_parallelism
+from parfun.profiler.object import PartitionedTaskTrace
 
 
 class TestParallelFunction(unittest.TestCase):
@@ -26,6 +34,116 @@ class TestParallelFunction(unittest.TestCase):
             combine_with=sum,
         )
 
+    def test_is_nested_parallelism(self):
+        self.assertFalse(is_nested_parallelism())
+
+        result, _ = apply_function(is_nested_parallelism, {}, (NamedArguments(), None))  # type: ignore[arg-type]
+        self.assertTrue(result)
+
+        self.assertFalse(is_nested_parallelism())
+
+    def test_micro_batch_size(self):
+        values = list(range(0, 100))
+        n_partitions = math.ceil(len(values) / 7)
+
+        for micro_batch_size in [1, 3, 1000]:
+            parallel_sum = ParallelFunction(
+                function=lambda values: sum(values),  # type: ignore[misc, arg-type]
+                function_name="lambda",
+                split=per_argument(values=list_by_chunk),
+                combine_with=sum,
+                fixed_partition_size=7,
+                micro_batch_size=micro_batch_size,
+            )
+
+            backend = _SubmitCountingBackend()
+            with set_parallel_backend_context(backend):
+                self.assertEqual(parallel_sum(values), sum(values))
+
+            self.assertEqual(backend.submit_count[0], math.ceil(n_partitions / micro_batch_size))
+
+        with self.assertRaises(ValueError):
+            ParallelFunction(
+                function=lambda values: sum(values),  # type: ignore[misc, arg-type]
+                function_name="lambda",
+                split=per_argument(values=list_by_chunk),
+                combine_with=sum,
+                micro_batch_size=0,
+            )
+
+    def test_unbatch_results(self):
+        """Makes sure the duration of every batch is split between its partitions, proportionally to their sizes."""
+
+        traces = [PartitionedTaskTrace(None, partition_size, 0) for partition_size in [1, 3, 2]]
+
+        results = list(_unbatch_results([([("a", traces[0]), ("b", traces[1])], 400), ([("c", traces[2])], 50)]))
+
+        self.assertEqual(results, [(("a", traces[0]), 100), (("b", traces[1]), 300), (("c", traces[2]), 50)])
+
+    def test_preload_values(self):
+        """Makes sure the function and its large non-partitioned arguments are preloaded once per call."""
+
+        backend = _PreloadRecordingBackend()
+
+        def function(values, constant):
+            return sum(values) * constant
+
+        parallel_function = ParallelFunction(
+            function=function,  # type: ignore[arg-type]
+            function_name="function",
+            split=per_argument(values=list_by_chunk),
+            combine_with=sum,
+            fixed_partition_size=10,
+        )
+
+        with set_parallel_backend_context(backend):
+            self.assertEqual(parallel_function(list(range(0, 100)), constant=2), sum(range(0, 100)) * 2)
+
+        # Small arguments are not preloaded.
+        self.assertEqual(backend.preloaded_values, [function])
+
+        backend.preloaded_values.clear()
+        constant = 2 ** (8 * 32 * 1024)
+
+        with set_parallel_backend_context(backend):
+            self.assertEqual(parallel_function(list(range(0, 100)), constant=constant), sum(range(0, 100)) * constant)
+
+        self.assertEqual(backend.preloaded_values, [function, {"constant": constant}])
+
+
+class _PreloadRecordingSession(LocalSingleProcessSession):
+    def __init__(self, preloaded_values: List[Any]):
+        self._preloaded_values = preloaded_values
+
+    def preload_value(self, value: Any) -> Any:
+        self._preloaded_values.append(value)
+        return value
+
+
+class _PreloadRecordingBackend(LocalSingleProcessBackend):
+    def __init__(self):
+        self.preloaded_values: List[Any] = []
+
+    def session(self) -> BackendSession:
+        return _PreloadRecordingSession(self.preloaded_values)
+
+
+class _SubmitCountingSession(LocalSingleProcessSession):
+    def __init__(self, submit_count: List[int]):
+        self._submit_count = submit_count
+
+    def submit(self, fn: Callable, *args, **kwargs) -> ProfiledFuture:
+        self._submit_count[0] += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class _SubmitCountingBackend(LocalSingleProcessBackend):
+    def __init__(self):
+        self.submit_count: List[int] = [0]
+
+    def session(self) -> BackendSession:
+        return _SubmitCountingSession(self.submit_count)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,21 @@
 import math
 import unittest
-from typing import List, cast
+from typing import Any, Dict, List, Tuple, cast
+from unittest.mock import PropertyMock, patch
 
 try:
     import pandas as pd
 except ImportError:
     raise ImportError("Pandas dependency missing. Use `pip install 'parfun[pandas]'` to install Pandas.")
 
-from parfun.partition.dataframe import df_by_group, df_by_row
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from parfun.partition.dataframe import _combine_arrow_chunks, df_by_group, df_by_row
 from parfun.partition.object import SmartPartitionGenerator
 from parfun.partition.utility import with_partition_size
 from tests.test_helpers import random_df
@@ -43,10 +51,41 @@ class TestPartitionDataframe(unittest.TestCase):
         test_with_params(
             [pd.DataFrame({"a": list("hello"), "b": list("world")}), random_df(rows=5, columns=3)], partition_size=2
         )
+        test_with_params(
+            [
+                pd.DataFrame(
+                    {
+                        "int": range(0, 7),
+                        "float": [0.5 * i for i in range(0, 7)],
+                        "date": pd.date_range("2024-01-01", periods=7),
+                        "object": pd.Series([{"i": i} for i in range(0, 7)], dtype=object),
+                    }
+                )
+            ],
+            partition_size=3,
+        )
+
+        # Tests if the generator dynamically adapts to varying chunk size.
+
+        input_df = random_df(rows=10, columns=2)
+
+        gen = cast(SmartPartitionGenerator, df_by_row(input_df))
+        next(gen)
+
+        for requested_size, expected_rows in [(3, (0, 3)), (3, (3, 6)), (1, (6, 7)), (5, (7, 10))]:
+            partition_size, (chunk,) = gen.send(requested_size)
+            self.assertEqual(partition_size, expected_rows[1] - expected_rows[0])
+            self.assertTrue(input_df.iloc[expected_rows[0] : expected_rows[1]].equals(chunk))
+
+        with self.assertRaises(StopIteration):
+            gen.send(5)
 
         with self.assertRaises(ValueError):
             test_with_params([random_df(rows=10, columns=23), random_df(rows=6, columns=3)], partition_size=5)
 
+        with self.assertRaises(ValueError):
+            test_with_params([random_df(rows=10, columns=2), [1, 2]], partition_size=5)  # type: ignore[list-item]
+
     def test_df_by_group(self):
         input_df = pd.DataFrame({"category": ["a", "a", "b", "a", "c", "c"], "values": [1, 2, 3, 4, 5, 6]})
 
@@ -84,6 +123,126 @@ class TestPartitionDataframe(unittest.TestCase):
         self.assertTrue(input_df.sort_values("category").equals(output_dfs[0]))
         self.assertTrue(input_df_2.sort_values("category").equals(output_dfs[1]))
 
+        # The other dataframes are partitioned by the groups of the first dataframe.
+
+        input_df_3 = pd.DataFrame({"values_3": input_df["values"] * 3})
+
+        for partition_df, partition_df_3 in with_partition_size(
+            df_by_group(by="category")(input_df, input_df_3), partition_size=1
+        ):
+            self.assertTrue(partition_df.index.equals(partition_df_3.index))
+            self.assertTrue((partition_df["values"] * 3).equals(partition_df_3["values_3"]))
+
+        # Tests if the generator correctly concatenates multiple groups of numerical values.
+
+        input_df_4 = random_df(rows=100, columns=4, low=0, high=10)
+        input_df_4.index = input_df_4.index * 2
+
+        partitions = list(with_partition_size(df_by_group(by=0)(input_df_4), partition_size=25))
+        self.assertLess(len(partitions), input_df_4[0].nunique())
+
+        output_df = pd.concat(df for df, in partitions)
+        self.assertTrue(input_df_4.sort_values(0, kind="stable").equals(output_df))
+
+        # Tests if the generator sizes partitions by group weight, and emits the heaviest groups first.
+
+        gen = cast(SmartPartitionGenerator, df_by_group(by="category", weight_fn=lambda df: len(df) ** 2)(input_df))
+        next(gen)
+
+        partition_size, chunk = gen.send(5)
+        self.assertEqual(partition_size, 9)
+        self.assertTrue(input_df[input_df["category"] == "a"].equals(chunk[0]))
+
+        partition_size, chunk = gen.send(5)
+        self.assertEqual(partition_size, 5)
+        self.assertTrue(input_df.iloc[[4, 5, 2]].equals(chunk[0]))
+
+        with self.assertRaises(StopIteration):
+            gen.send(5)
+
+        for invalid_weight in [math.nan, math.inf, -1.0]:
+            with self.assertRaises(ValueError):
+                list(with_partition_size(df_by_group(by="category", weight_fn=lambda df: invalid_weight)(input_df), 5))
+
+        # Tests if the generator yields the same groups as Pandas' groupby() for multiple keys, missing values and
+        # non-column groupers.
+
+        input_df_5 = pd.DataFrame(
+            {"a": [2, None, 1, 2, 1, 3, 2], "b": list("yxxyzxx"), "values": range(0, 7)}, index=list("gfedcba")
+        )
+
+        groupby_params: List[Tuple[Tuple, Dict[str, Any]]] = [
+            ((), {"by": ["b", "a"]}),
+            ((), {"by": ["b", "a"], "sort": False}),
+            (("a",), {}),
+            ((), {"by": lambda label: label in "abc"}),
+        ]
+
+        for groupby_args, groupby_kwargs in groupby_params:
+            expected_df = pd.concat(group for _, group in input_df_5.groupby(*groupby_args, **groupby_kwargs))
+
+            output_df = pd.concat(
+                df for df, in with_partition_size(df_by_group(*groupby_args, **groupby_kwargs)(input_df_5), 2)
+            )
+
+            self.assertTrue(expected_df.equals(output_df))
+
+        # Raises the same errors as Pandas' groupby() for ambiguous or non-column keys.
+
+        input_df_6 = input_df_5.set_index(pd.Index(range(0, 7), name="a"))
+        input_df_7 = pd.DataFrame([[1, 2], [3, 4]], columns=pd.MultiIndex.from_tuples([("x", "y"), ("x", "z")]))
+
+        for invalid_df, by in [(input_df_6, "a"), (input_df_7, "x")]:
+            with self.assertRaises(ValueError):
+                invalid_df.groupby(by=by)
+
+            with self.assertRaises(ValueError):
+                list(with_partition_size(df_by_group(by=by)(invalid_df), partition_size=2))
+
+    def test_combine_arrow_chunks_numpy(self):
+        """Makes sure that dataframes without PyArrow columns are returned as is, without accessing their columns."""
+
+        input_df = random_df(rows=10, columns=100)
+
+        with patch.object(pd.DataFrame, "iloc", new_callable=PropertyMock) as iloc:
+            self.assertIs(_combine_arrow_chunks(input_df), input_df)
+
+        iloc.assert_not_called()
+
+    @unittest.skipUnless(HAS_PYARROW, "PyArrow not installed")
+    def test_arrow_dtypes(self):
+        """Makes sure that partitioning PyArrow backed dataframes preserves their dtypes."""
+
+        input_df = pd.DataFrame({"category": list("abacbca"), "values": range(0, 7)}).convert_dtypes(
+            dtype_backend="pyarrow"
+        )
+
+        for partition_function in [df_by_row, df_by_group(by="category")]:
+            partitions = list(with_partition_size(partition_function(input_df), partition_size=2))
+
+            for (partition_df,) in partitions:
+                self.assertTrue(all(isinstance(dtype, pd.ArrowDtype) for dtype in partition_df.dtypes))
+
+            output_df = pd.concat(df for df, in partitions).sort_index()
+            self.assertTrue(input_df.equals(output_df))
+
+        # Chunked Arrow columns are combined into a single chunk, without modifying the input dataframe.
+
+        chunked_df = pd.concat([input_df, input_df], ignore_index=True)
+        self.assertEqual(chunked_df["values"].array.__arrow_array__().num_chunks, 2)
+
+        for partition_function in [df_by_row, df_by_group(by="category")]:
+            partitions = list(with_partition_size(partition_function(chunked_df), partition_size=3))
+
+            for (partition_df,) in partitions:
+                for column in partition_df.columns:
+                    self.assertEqual(partition_df[column].array.__arrow_array__().num_chunks, 1)
+
+            output_df = pd.concat(df for df, in partitions).sort_index()
+            self.assertTrue(chunked_df.equals(output_df))
+
+        self.assertEqual(chunked_df["values"].array.__arrow_array__().num_chunks, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,7 +11,7 @@ except ImportError:
 from parfun.partition.collection import list_by_chunk
 from parfun.partition.dataframe import df_by_group, df_by_row
 from parfun.partition.object import SimplePartitionIterator
-from parfun.partition.primitives import partition_flatmap, partition_map, partition_zip
+from parfun.partition.primitives import partition_flatmap, partition_map, partition_prefetch, partition_zip
 from parfun.partition.utility import with_partition_size
 
 
@@ -102,6 +102,51 @@ class TestPartitionPrimitives(unittest.TestCase):
 
         self.assertEqual(len(partitions), N_YEARS * math.ceil(N_DAYS / 7))
 
+    def test_partition_prefetch(self):
+        N = 100
+        PARTITION_SIZE = 7
+
+        xs = list(range(0, N))
+        df = pd.DataFrame({"group": [x % 13 for x in xs], "value": xs})
+
+        # Smart generators
+
+        for ahead in [1, 3, 1000]:
+            expected = list(with_partition_size(list_by_chunk(xs), partition_size=PARTITION_SIZE))
+            prefetched = list(
+                with_partition_size(partition_prefetch(list_by_chunk(xs), ahead=ahead), partition_size=PARTITION_SIZE)
+            )
+            self.assertEqual(expected, prefetched)
+
+            expected_dfs = list(with_partition_size(df_by_group(by="group")(df), partition_size=PARTITION_SIZE))
+            prefetched_dfs = list(
+                with_partition_size(
+                    partition_prefetch(df_by_group(by="group")(df), ahead=ahead), partition_size=PARTITION_SIZE
+                )
+            )
+            self.assertEqual(len(expected_dfs), len(prefetched_dfs))
+            for (expected_df,), (prefetched_df,) in zip(expected_dfs, prefetched_dfs):
+                self.assertTrue(expected_df.equals(prefetched_df))
+
+        # Regular generators
+
+        self.assertEqual(list(partition_prefetch(iter_xs for iter_xs in xs)), xs)  # type: ignore[arg-type]
+
+        # Exceptions
+
+        def failing_generator() -> Generator:
+            yield 1
+            raise KeyError()
+
+        with self.assertRaises(KeyError):
+            list(partition_prefetch(failing_generator()))
+
+        # Early termination
+
+        generator = partition_prefetch(iter_xs for iter_xs in xs)  # type: ignore[arg-type]
+        self.assertEqual(next(generator), 0)
+        generator.close()
+
 
 if __name__ == "__main__":
     unittest.main()